@@ -1,24 +1,77 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import functools
 import os
 import random
+import re
+import shutil
+import signal
 import subprocess
 import sys
-import threading
-import traceback
-from datetime import datetime
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
 from config.persona_utils import PersonaManager
 from meetingbaas_pipecat.utils.logger import configure_logger
 
-load_dotenv(override=True)
-
 logger = configure_logger()
 
+# Resolved once so children are spawned with an absolute executable path,
+# skipping the per-spawn PATH search.
+_POETRY = shutil.which("poetry") or "poetry"
+
+_LEVEL_RE = re.compile(rb"\b(ERROR|WARNING|SUCCESS)\b")
+_LEVEL_DISPATCH = {
+    b"ERROR": logger.error,
+    b"WARNING": logger.warning,
+    b"SUCCESS": logger.success,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _venv_bin() -> Optional[str]:
+    """Resolve the poetry venv's bin directory once per process.
+
+    Lets us exec the bot and meetingbaas entrypoints directly instead of
+    paying a `poetry run` wrapper interpreter (pyproject parse + venv
+    resolution) for every child.
+    """
+    try:
+        venv_path = subprocess.check_output(
+            [_POETRY, "env", "info", "--path"], text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Could not resolve poetry venv, falling back to poetry run: {e}")
+        return None
+    return os.path.join(venv_path, "Scripts" if sys.platform == "win32" else "bin")
+
+
+def _entrypoint(name: str) -> list[str]:
+    """Build the command prefix for a venv entrypoint script"""
+    venv_bin = _venv_bin()
+    if venv_bin:
+        return [os.path.join(venv_bin, name)]
+    return [_POETRY, "run", name]
+
+
+@functools.lru_cache(maxsize=1)
+def _persona_manager() -> PersonaManager:
+    """Lazily construct a single shared PersonaManager.
+
+    PersonaManager loads the persona catalog from disk on init, so repeated
+    bot starts in the same process should not pay that cost again.
+    """
+    return PersonaManager()
+
+
+@functools.lru_cache(maxsize=1)
+def _persona_names() -> Tuple[str, ...]:
+    """Persona names, cached as a tuple for membership tests and random.choice"""
+    return tuple(_persona_manager().list_personas())
+
 
 def validate_url(url):
     """Validates the URL format, ensuring it starts with https://"""
@@ -27,9 +80,11 @@ def validate_url(url):
     return url
 
 
-def get_user_input(prompt, validator=None):
+async def get_user_input(prompt, validator=None):
+    """Prompt on stdin without blocking the event loop"""
+    loop = asyncio.get_running_loop()
     while True:
-        user_input = input(prompt).strip()
+        user_input = (await loop.run_in_executor(None, input, prompt)).strip()
         if validator:
             try:
                 return validator(user_input)
@@ -39,89 +94,154 @@ def get_user_input(prompt, validator=None):
             return user_input
 
 
+@dataclass(slots=True)
+class ProcEntry:
+    """Book-keeping for one managed child process"""
+
+    process: asyncio.subprocess.Process
+    command: list[str]
+    tasks: Tuple[asyncio.Task, ...]
+    pidfd: Optional[int] = None
+
+
 class BotManager:
     def __init__(self):
-        self.processes: Dict = {}
-        self.start_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.processes: Dict[str, ProcEntry] = {}
         self.shutdown_event = asyncio.Event()
         self.selected_persona_name = None
 
-    def run_command(self, command: list[str], name: str) -> Optional[subprocess.Popen]:
+    async def _pump(self, stream: asyncio.StreamReader, prefix: str) -> None:
+        """Drain a child pipe, tagging and classifying each line.
+
+        Lines are classified on the raw bytes with a single compiled-regex
+        pass and only decoded once the log level is known.
+        """
+        async for raw in stream:
+            raw = raw.strip()
+            if not raw:
+                continue
+            match = _LEVEL_RE.search(raw)
+            log = _LEVEL_DISPATCH[match.group(1)] if match else logger.info
+            # Loguru formats the message lazily, so no f-string is built
+            # here for records a sink ends up discarding.
+            log("{}: {}", prefix, raw.decode("utf-8", "replace"))
+
+    async def run_command(
+        self, command: list[str], name: str
+    ) -> Optional[asyncio.subprocess.Process]:
         """Run a command and store the process"""
         try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+            # stderr is merged into stdout at the OS level: one pipe and one
+            # reader per child, with the same per-line level classification.
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=1 << 20,
             )
 
-            def log_output(stream, prefix):
-                for line in stream:
-                    line = line.strip()
-                    if line:
-                        if "ERROR" in line:
-                            logger.error(f"{prefix}: {line}")
-                        elif "WARNING" in line:
-                            logger.warning(f"{prefix}: {line}")
-                        elif "SUCCESS" in line:
-                            logger.success(f"{prefix}: {line}")
-                        else:
-                            logger.info(f"{prefix}: {line}")
-
-            threading.Thread(
-                target=log_output, args=(process.stdout, f"{name}"), daemon=True
-            ).start()
-            threading.Thread(
-                target=log_output, args=(process.stderr, f"{name}"), daemon=True
-            ).start()
-
-            self.processes[name] = {"process": process, "command": command}
+            tasks = (asyncio.create_task(self._pump(process.stdout, name)),)
+
+            self.processes[name] = ProcEntry(
+                process=process,
+                command=command,
+                tasks=tasks,
+                pidfd=self._watch_exit(name, process),
+            )
             return process
         except Exception as e:
-            logger.error(f"Failed to start {name}: {e}")
-            logger.error(
-                "".join(traceback.format_exception(type(e), e, e.__traceback__))
-            )
+            logger.exception(f"Failed to start {name}: {e}")
             return None
 
-    async def cleanup(self):
-        """Cleanup all processes"""
+    async def _wait_for_port(self, port: int, timeout: float = 10.0) -> bool:
+        """Wait until the bot is actually accepting connections on its port.
+
+        Probes with exponential backoff instead of a fixed startup sleep, so
+        the meeting can start as soon as the bot is listening. The bot binary
+        prints no readiness sentinel we control, so the open port is the
+        readiness signal.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while loop.time() < deadline:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
+            else:
+                writer.close()
+                return True
+        logger.warning(f"Bot did not start listening on port {port} within {timeout}s")
+        return False
+
+    async def _terminate(self, name: str, entry: ProcEntry) -> None:
+        """Terminate one process, escalating to SIGKILL after a 1s grace period"""
+        logger.info(f"Terminating process: {name}")
+        process = entry.process
         try:
-            for name, process_info in self.processes.items():
-                logger.info(f"Terminating process: {name}")
-                process = process_info["process"]
+            if process.returncode is None:
+                process.terminate()
                 try:
-                    process.terminate()
-                    await asyncio.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
-                    logger.success(f"Process {name} terminated successfully")
-                except Exception as e:
-                    logger.error(f"Error terminating process {name}: {e}")
+                    await asyncio.wait_for(process.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+            # Let the pump drain any buffered final output (crash
+            # tracebacks, exit messages) before declaring the process done.
+            await asyncio.gather(*entry.tasks, return_exceptions=True)
+            logger.success(f"Process {name} terminated successfully")
+        except Exception as e:
+            logger.error(f"Error terminating process {name}: {e}")
 
+    async def cleanup(self):
+        """Cleanup all processes"""
+        try:
+            await asyncio.gather(
+                *(
+                    self._terminate(name, entry)
+                    for name, entry in self.processes.items()
+                )
+            )
             logger.success("Cleanup completed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
-    async def monitor_processes(self) -> None:
-        """Monitor running processes and handle failures"""
-        while not self.shutdown_event.is_set():
+    def _watch_exit(self, name: str, process: asyncio.subprocess.Process) -> Optional[int]:
+        """Arrange an event-driven notification for when a child exits.
+
+        On Linux >= 5.3 this registers the child's pidfd with the event loop
+        so the kernel wakes us exactly once on exit; elsewhere it falls back
+        to a task awaiting the process, which is still poll-free.
+        """
+        loop = asyncio.get_running_loop()
+        if hasattr(os, "pidfd_open"):
             try:
-                for name, process_info in list(self.processes.items()):
-                    process = process_info["process"]
-                    if process.poll() is not None:
-                        logger.warning(
-                            f"Process {name} exited with code: {process.returncode}"
-                        )
-                await asyncio.sleep(1)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error monitoring processes: {e}")
-                await asyncio.sleep(1)
+                fd = os.pidfd_open(process.pid)
+            except OSError:
+                pass
+            else:
+                loop.add_reader(
+                    fd, functools.partial(self._on_child_exit, name, fd, process)
+                )
+                return fd
+        asyncio.create_task(self._report_exit(name, process))
+        return None
+
+    def _on_child_exit(
+        self, name: str, fd: int, process: asyncio.subprocess.Process
+    ) -> None:
+        asyncio.get_running_loop().remove_reader(fd)
+        os.close(fd)
+        asyncio.create_task(self._report_exit(name, process))
+
+    async def _report_exit(
+        self, name: str, process: asyncio.subprocess.Process
+    ) -> None:
+        returncode = await process.wait()
+        if not self.shutdown_event.is_set():
+            logger.warning(f"Process {name} exited with code: {returncode}")
 
     async def async_main(self) -> None:
         parser = argparse.ArgumentParser(
@@ -142,9 +262,15 @@ class BotManager:
         )
         args = parser.parse_args()
 
+        if sys.platform != "win32":
+            # Windows doesn't support loop.add_signal_handler
+            loop = asyncio.get_running_loop()
+            loop.add_signal_handler(signal.SIGINT, self.shutdown_event.set)
+            loop.add_signal_handler(signal.SIGTERM, self.shutdown_event.set)
+
         meeting_url = args.meeting_url
         if not meeting_url:
-            meeting_url = get_user_input(
+            meeting_url = await get_user_input(
                 "Enter the meeting URL (must start with https://): ", validate_url
             )
 
@@ -152,8 +278,8 @@ class BotManager:
             logger.info("Starting bot with random persona selection...")
 
             # Handle persona selection
-            available_personas = PersonaManager().list_personas()
-            
+            available_personas = _persona_names()
+
             if args.persona:
                 if args.persona not in available_personas:
                     raise ValueError(f"Persona '{args.persona}' not found in available personas")
@@ -161,70 +287,58 @@ class BotManager:
             else:
                 self.selected_persona_name = random.choice(available_personas)
 
-            persona = PersonaManager().get_persona(self.selected_persona_name)
+            persona = _persona_manager().get_persona(self.selected_persona_name)
             bot_prompt = persona["prompt"]
             
             logger.warning(f"Selected persona: {self.selected_persona_name}")
             logger.warning(f"System prompt: {bot_prompt}")
 
-            # Start bot
+            # Start bot and meeting concurrently; the two spawns are
+            # independent, so the meeting wrapper's startup overlaps the
+            # bot's instead of waiting behind it.
             bot_port = args.port
-            bot_name = "bot"
-            bot_process = self.run_command(
-                [
-                    "poetry",
-                    "run",
-                    "bot",
-                    "-p",
-                    str(bot_port),
-                    "--system-prompt",
-                    bot_prompt,
-                    "--persona-name",
-                    self.selected_persona_name,
-                    "--voice-id",
-                    "40104aff-a015-4da1-9912-af950fbec99e",
-                ],
-                bot_name,
+            bot_command = _entrypoint("bot") + [
+                "-p",
+                str(bot_port),
+                "--system-prompt",
+                bot_prompt,
+                "--persona-name",
+                self.selected_persona_name,
+                "--voice-id",
+                "40104aff-a015-4da1-9912-af950fbec99e",
+            ]
+            meeting_command = _entrypoint("meetingbaas") + [
+                "--meeting-url",
+                meeting_url,
+                "--persona-name",
+                self.selected_persona_name,
+            ]
+            bot_process, meeting_process = await asyncio.gather(
+                self.run_command(bot_command, "bot"),
+                self.run_command(meeting_command, "meeting"),
             )
 
             if not bot_process:
                 logger.error("Failed to start bot")
                 return
 
-            await asyncio.sleep(1)
-
-            # Start meeting
-            meeting_name = "meeting"
-            meeting_process = self.run_command(
-                [
-                    "poetry",
-                    "run",
-                    "meetingbaas",
-                    "--meeting-url",
-                    meeting_url,
-                    "--persona-name",
-                    self.selected_persona_name,
-                ],
-                meeting_name,
-            )
-
             if not meeting_process:
                 logger.error("Failed to start meeting")
                 return
 
+            if not await self._wait_for_port(bot_port):
+                logger.error("Bot never became ready, shutting down")
+                return
+
             logger.success("Successfully started bot and meeting processes")
             logger.info("Press Ctrl+C to stop all processes")
 
-            # Start process monitor
-            monitor_task = asyncio.create_task(self.monitor_processes())
-
             try:
                 await self.shutdown_event.wait()
             except asyncio.CancelledError:
                 logger.info("\nReceived shutdown signal")
             finally:
                 self.shutdown_event.set()
-                await monitor_task
 
         except KeyboardInterrupt:
             logger.info("\nReceived shutdown signal (Ctrl+C)")
@@ -236,27 +350,9 @@ class BotManager:
 
     def main(self) -> None:
         """Main entry point with proper signal handling"""
+        load_dotenv(override=True)
         try:
-            if sys.platform != "win32":
-                # Set up signal handlers for Unix-like systems
-                import signal
-
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-                def signal_handler():
-                    self.shutdown_event.set()
-
-                loop.add_signal_handler(signal.SIGINT, signal_handler)
-                loop.add_signal_handler(signal.SIGTERM, signal_handler)
-
-                try:
-                    loop.run_until_complete(self.async_main())
-                finally:
-                    loop.close()
-            else:
-                # Windows doesn't support loop.add_signal_handler
-                asyncio.run(self.async_main())
+            asyncio.run(self.async_main())
         except Exception as e:
             logger.exception(f"Fatal error in main program: {e}")
             sys.exit(1)